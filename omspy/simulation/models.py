@@ -42,6 +42,11 @@ class OrderType(Enum):
     LIMIT = 2
 
 
+# string values accepted for side and order type in orders
+_SIDES = {"b": Side.BUY, "s": Side.SELL}
+_ORDER_TYPES = {"LIMIT": OrderType.LIMIT, "MARKET": OrderType.MARKET}
+
+
 class OHLC(BaseModel):
     open: float
     high: float
@@ -58,6 +63,19 @@ class OHLCVI(OHLCV):
     open_interest: int
 
 
+def _random_walk(last_price: float, rng: Any = random) -> float:
+    """
+    next price of a random walk from the given last price
+    rng
+        random number generator to use, defaults to the random module
+    Note
+    ----
+    1) change is drawn from a normal distribution with 1%
+    standard deviation and rounded to a tick of 0.05
+    """
+    return round((last_price + rng.gauss(0, 1) * last_price * 0.01) * 20) / 20
+
+
 class Ticker(BaseModel):
     """
     A simple ticker class to generate fake data
@@ -84,6 +102,7 @@ class Ticker(BaseModel):
     _high: float = PrivateAttr()
     _low: float = PrivateAttr()
     _ltp: float = PrivateAttr()
+    _rng: Any = PrivateAttr(default=None)  # random module if not seeded
 
     def __init__(self, **data):
         super().__init__(**data)
@@ -91,10 +110,19 @@ class Ticker(BaseModel):
         self._low = self.initial_price
         self._ltp = self.initial_price
 
+    def seed(self, n: Optional[int] = None):
+        """
+        use a separate random number generator seeded with n
+        for this ticker instead of the global random module
+        """
+        self._rng = random.Random(n)
+
     def _update_values(self, last_price: float):
         self._ltp = last_price
-        self._high = max(self._high, last_price)
-        self._low = min(self._low, last_price)
+        if last_price > self._high:
+            self._high = last_price
+        elif last_price < self._low:
+            self._low = last_price
 
     @property
     def is_random(self) -> bool:
@@ -109,10 +137,7 @@ class Ticker(BaseModel):
         Get the last price and update it
         """
         if self.is_random:
-            diff = random.gauss(0, 1) * self._ltp * 0.01
-            last_price = self._ltp + diff
-            last_price = round(last_price * 20) / 20
-            self._update_values(last_price)
+            self._update_values(_random_walk(self._ltp, self._rng or random))
         return self._ltp
 
     def update(self, last_price: float) -> float:
@@ -126,12 +151,13 @@ class Ticker(BaseModel):
         """
         Calculate the ohlc for this ticker
         """
-        return OHLC(
+        ltp = float(self._ltp)
+        return OHLC.construct(
             open=self.initial_price,
-            high=self._high,
-            low=self._low,
-            close=self._ltp,
-            last_price=self._ltp,
+            high=float(self._high),
+            low=float(self._low),
+            close=ltp,
+            last_price=ltp,
         )
 
 
@@ -180,12 +206,10 @@ class VOrder(BaseModel):
     @validator("side", pre=True, always=True)
     def accept_buy_sell_as_side(cls, v):
         if isinstance(v, str):
-            if v.lower()[0] == "b":
-                return Side.BUY
-            elif v.lower()[0] == "s":
-                return Side.SELL
-            else:
+            side = _SIDES.get(v[:1].lower())
+            if side is None:
                 raise TypeError(f"{v} is not a valid side, should be buy or sell")
+            return side
         else:
             return v
 
@@ -196,14 +220,12 @@ class VOrder(BaseModel):
         should be market or limit
         """
         if isinstance(v, str):
-            if v.upper() == "LIMIT":
-                return OrderType.LIMIT
-            elif v.upper() == "MARKET":
-                return OrderType.MARKET
-            else:
+            order_type = _ORDER_TYPES.get(v.upper())
+            if order_type is None:
                 raise TypeError(
                     f"{v} is not a valid  order type, should be one of LIMIT/MARKET"
                 )
+            return order_type
         else:
             return v
 
@@ -223,18 +245,21 @@ class VOrder(BaseModel):
         self.canceled_quantity = q.c
 
     def __init__(self, **data):
+        if data.get("timestamp") is None:
+            data["timestamp"] = pendulum.now(tz="local")
         super().__init__(**data)
-        if self.timestamp is None:
-            self.timestamp = pendulum.now(tz="local")
         self._make_right_quantity()
         if self.average_price is None:
             self.average_price = 0
         self._delay = 1e6  # delay in microseconds
 
-    def _modify_order_by_status(self, status: Status):
+    def _modify_order_by_status(self, status: Status, rng: Any = None):
         """
         Modify an order quantity based on the given status
+        rng
+            random number generator to use, defaults to the random module
         """
+        rng = rng or random
         if status in (Status.CANCELED, Status.REJECTED):
             self.filled_quantity = 0
             self.pending_quantity = 0
@@ -244,13 +269,13 @@ class VOrder(BaseModel):
             self.pending_quantity = self.pending_quantity
             self.canceled_quantity = 0
         elif status == Status.PARTIAL_FILL:
-            a = random.randrange(1, int(self.quantity))
+            a = rng.randrange(1, int(self.quantity))
             b = self.quantity - a
             self.filled_quantity = a
             self.pending_quantity = 0
             self.canceled_quantity = b
         elif status == Status.PENDING:
-            a = random.randrange(1, int(self.quantity))
+            a = rng.randrange(1, int(self.quantity))
             b = self.quantity - a
             self.filled_quantity = a
             self.pending_quantity = b
@@ -340,15 +365,19 @@ class VOrder(BaseModel):
         else:
             return False
 
-    def modify_by_status(self, status: Status = Status.COMPLETE) -> bool:
+    def modify_by_status(
+        self, status: Status = Status.COMPLETE, rng: Any = None
+    ) -> bool:
         """
         Modify order by status
+        rng
+            random number generator to use, defaults to the random module
         returns True if the order is modified else False
         """
         if self.is_done:
             return False
         if self.is_past_delay:
-            self._modify_order_by_status(status)
+            self._modify_order_by_status(status, rng)
             return True
         else:
             return False
@@ -441,9 +470,9 @@ class Response(BaseModel):
         validate_assignment = True
 
     def __init__(self, **data):
+        if data.get("timestamp") is None:
+            data["timestamp"] = pendulum.now(tz="local")
         super().__init__(**data)
-        if self.timestamp is None:
-            self.timestamp = pendulum.now(tz="local")
 
 
 class OrderResponse(Response):
@@ -1,8 +1,9 @@
 import random
 import uuid
 import logging
-from functools import wraps
-from typing import Optional, Dict, Set, List, Union, Any, Callable
+import pendulum
+from functools import wraps, lru_cache
+from typing import Optional, Dict, Set, List, Tuple, Union, Any, Callable
 from omspy.models import OrderBook, Quote
 from pydantic import BaseModel, PrivateAttr, confloat, ValidationError, Field
 from enum import Enum
@@ -28,6 +29,9 @@ from omspy.simulation.models import (
 SUCCESS = ResponseStatus.SUCCESS
 FAILURE = ResponseStatus.FAILURE
 
+# order fields accepted by VirtualBroker.order_place
+_ORDER_FIELDS = frozenset(VOrder.__fields__)
+
 
 def user_response(f: Callable):
     """
@@ -46,6 +50,15 @@ def user_response(f: Callable):
     return wrapper
 
 
+def _order_not_found(order_id: str) -> OrderResponse:
+    """
+    failure response for an order id not found on the system
+    """
+    return OrderResponse(
+        status=FAILURE, error_msg=f"Order id {order_id} not found on system"
+    )
+
+
 def _iterate_method(
     method: Callable, symbol: Union[str, Iterable], **kwargs
 ) -> Dict[str, Any]:
@@ -81,6 +94,38 @@ def generate_price(start: int = 100, end: int = 110) -> int:
     return random.randrange(start, end)
 
 
+def generate_prices(n: int, start: int = 100, end: int = 110) -> List[int]:
+    """
+    Generate n random prices in the given range between start and end
+    n
+        number of prices
+    start
+        starting value
+    end
+        ending value
+    Note
+    ----
+    1) If the start value is greater than end value, the values are swapped
+    2) prices are the same as calling generate_price n times
+    """
+    if start > end:
+        start, end = end, start
+    randrange = random.randrange
+    return [randrange(start, end) for i in range(n)]
+
+
+@lru_cache(maxsize=128)
+def _orderbook_prices(
+    bid: float, ask: float, depth: int, tick: float
+) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """
+    bid and ask prices for each level of the orderbook
+    """
+    bids = tuple(float(bid - i * tick) for i in range(depth))
+    asks = tuple(float(ask + i * tick) for i in range(depth))
+    return bids, asks
+
+
 def generate_orderbook(
     bid: float = 100.0,
     ask: float = 100.05,
@@ -108,28 +153,38 @@ def generate_orderbook(
     using randrange function
     3) num of orders is randomly picked between 5 to 15
     4) if bid price is greater than ask, the values are swapped
+    5) quotes are built without validation since all the values
+    are generated here
+    6) prices for each level are cached for the same bid, ask, depth and tick
     """
     if bid > ask:
         bid, ask = ask, bid
     asks = []
     bids = []
     q1, q2 = int(quantity * 0.5), int(quantity * 1.5)
-    for i in range(depth):
-        bid_qty = random.randrange(q1, q2)
-        ask_qty = random.randrange(q1, q2)
-        b = Quote(
-            price=bid - i * tick,
-            quantity=bid_qty,
-            orders_count=min(random.randrange(5, 15), bid_qty),
+    randrange = random.randrange
+    construct = Quote.construct
+    bid_prices, ask_prices = _orderbook_prices(bid, ask, depth, tick)
+    for bid_price, ask_price in zip(bid_prices, ask_prices):
+        bid_qty = randrange(q1, q2)
+        ask_qty = randrange(q1, q2)
+        bid_orders = randrange(5, 15)
+        ask_orders = randrange(5, 15)
+        bids.append(
+            construct(
+                price=bid_price,
+                quantity=bid_qty,
+                orders_count=bid_orders if bid_orders < bid_qty else bid_qty,
+            )
         )
-        a = Quote(
-            price=ask + i * tick,
-            quantity=ask_qty,
-            orders_count=min(random.randrange(5, 15), ask_qty),
+        asks.append(
+            construct(
+                price=ask_price,
+                quantity=ask_qty,
+                orders_count=ask_orders if ask_orders < ask_qty else ask_qty,
+            )
         )
-        bids.append(b)
-        asks.append(a)
-    return OrderBook(ask=asks, bid=bids)
+    return OrderBook.construct(ask=asks, bid=bids)
 
 
 def generate_ohlc(start: int = 100, end: int = 110, volume: int = 10000) -> OHLCV:
@@ -147,6 +202,8 @@ def generate_ohlc(start: int = 100, end: int = 110, volume: int = 10000) -> OHLC
     ----
     1) ohlc is generated between start and end values
     2) volume is generated based on given value
+    3) ohlc is built without validation since all the values
+    are generated here
     """
     if start > end:
         start, end = end, start
@@ -160,7 +217,14 @@ def generate_ohlc(start: int = 100, end: int = 110, volume: int = 10000) -> OHLC
         v = random.randrange(int(volume * 0.5), int(volume * 2))
     else:
         v = random.randrange(1000, 200000)
-    return OHLCV(open=o, high=high, low=low, close=c, volume=v, last_price=ltp)
+    return OHLCV.construct(
+        open=float(o),
+        high=float(high),
+        low=float(low),
+        close=float(c),
+        volume=v,
+        last_price=float(ltp),
+    )
 
 
 class FakeBroker(BaseModel):
@@ -228,8 +292,14 @@ class FakeBroker(BaseModel):
             symbol could be a single symbol or a list of tuple of symbols
         kwargs
             can provide start and end arguments to generate price within the range
+        Note
+        ----
+        1) prices for an iterable of symbols are generated in a single batch
         """
-        return _iterate_method(self._ltp, symbol, **kwargs)
+        if isinstance(symbol, str) or not (isinstance(symbol, Iterable)):
+            return _iterate_method(self._ltp, symbol, **kwargs)
+        symbols = list(symbol)
+        return dict(zip(symbols, generate_prices(len(symbols), **kwargs)))
 
     def _orderbook(self, symbol: str, **kwargs) -> Dict[str, OrderBook]:
         """
@@ -478,20 +548,37 @@ class VirtualBroker(BaseModel):
     _orders: Dict[str, VOrder] = PrivateAttr()
     _clients: Set[str] = PrivateAttr()
     _delay: int = PrivateAttr()  # delay in microseconds for updating orders
+    _rng: Any = PrivateAttr(default=None)  # random module if not seeded
+    _order_prefix: str = PrivateAttr()
+    _order_seq: int = PrivateAttr()
 
     class Config:
         validate_assignment = True
 
     def __init__(self, **data):
         super().__init__(**data)
-        self._orders = defaultdict(list)
+        self._orders = dict()
         self._clients = set()
         self._delay = 1e6
+        # order ids are a random prefix per broker with a sequence number
+        self._order_prefix = uuid.uuid4().hex[:12]
+        self._order_seq = 0
 
     @property
     def clients(self) -> Set[str]:
         return self._clients
 
+    def seed(self, n: Optional[int] = None):
+        """
+        use a separate random number generator seeded with n
+        for this broker instead of the global random module
+        Note
+        ----
+        1) the generator is used for failures and for updating
+        orders by status in get
+        """
+        self._rng = random.Random(n)
+
     @property
     def is_failure(self) -> bool:
         """
@@ -499,12 +586,14 @@ class VirtualBroker(BaseModel):
         Note
         ----
         1) status is determined based on the failure rate
+        2) no random number is drawn if the failure rate is 0 or 1
         """
-        num = random.random()
-        if num < self.failure_rate:
-            return True
-        else:
+        failure_rate = self.failure_rate
+        if failure_rate <= 0:
             return False
+        elif failure_rate >= 1:
+            return True
+        return (self._rng or random).random() < failure_rate
 
     def get(
         self, order_id: str, status: Status = Status.COMPLETE
@@ -514,7 +603,7 @@ class VirtualBroker(BaseModel):
         """
         order: VOrder = self._orders.get(order_id)
         if order:
-            order.modify_by_status(status)
+            order.modify_by_status(status, self._rng)
             return order
         else:
             return None
@@ -538,21 +627,18 @@ class VirtualBroker(BaseModel):
         if self.is_failure:
             return OrderResponse(status=FAILURE, error_msg="Unexpected error")
         else:
-            order_id = uuid.uuid4().hex
-            keys = VOrder.__fields__.keys()
-            order_args = dict(order_id=order_id)
+            self._order_seq += 1
+            order_id = f"{self._order_prefix}{self._order_seq:x}"
+            timestamp = pendulum.now(tz="local")
+            order_args = dict(order_id=order_id, timestamp=timestamp)
+            order_args.update({k: v for k, v in kwargs.items() if k in _ORDER_FIELDS})
             is_user: bool = False
             userid: Optional[str] = None
-            delay: int = self._delay
-            for k, v in kwargs.items():
-                if k == "userid":
-                    userid = str(v).upper()
-                    if userid in self.clients:
-                        is_user = True
-                if k == "delay":
-                    delay = v
-                elif k in keys:
-                    order_args[k] = v
+            delay: int = kwargs.get("delay", self._delay)
+            if "userid" in kwargs:
+                userid = str(kwargs["userid"]).upper()
+                if userid in self.clients:
+                    is_user = True
             try:
                 resp = VOrder(**order_args)
                 resp._delay = delay
@@ -562,29 +648,27 @@ class VirtualBroker(BaseModel):
                         if user.userid == userid:
                             user.orders.append(resp)
                             break
-                return OrderResponse(status=SUCCESS, data=resp)
+                return OrderResponse(status=SUCCESS, data=resp, timestamp=timestamp)
             except ValidationError as e:
                 errors: List = e.errors()
                 num = len(errors)
                 fld = errors[0].get("loc")[0]
                 msg = errors[0].get("msg")
                 error_msg = f"Found {num} validation errors; in field {fld} {msg}"
-                return OrderResponse(status=FAILURE, error_msg=error_msg)
+                return OrderResponse(
+                    status=FAILURE, error_msg=error_msg, timestamp=timestamp
+                )
 
     def order_modify(
         self, order_id: str, **kwargs
     ) -> Union[OrderResponse, Dict[Any, Any]]:
         if "response" in kwargs:
             return kwargs["response"]
+        if order_id not in self._orders:
+            return _order_not_found(order_id)
         if self.is_failure:
             return OrderResponse(status=FAILURE, error_msg="Unexpected error")
-        if order_id not in self._orders:
-            return OrderResponse(
-                status=FAILURE,
-                error_msg=f"Order id {order_id} not found on system",
-            )
         attribs = ("price", "trigger_price", "quantity")
-        dict(order_id=order_id)
         order = self.get(order_id)
         for attrib in attribs:
             if attrib in kwargs:
@@ -596,28 +680,18 @@ class VirtualBroker(BaseModel):
     ) -> Union[OrderResponse, Dict[Any, Any]]:
         if "response" in kwargs:
             return kwargs["response"]
+        if order_id not in self._orders:
+            return _order_not_found(order_id)
         if self.is_failure:
             return OrderResponse(status=FAILURE, error_msg="Unexpected error")
-        if order_id not in self._orders:
-            return OrderResponse(
-                status=FAILURE,
-                error_msg=f"Order id {order_id} not found on system",
-            )
         order = self.get(order_id)
-        if order:
-            if order.status == Status.COMPLETE:
-                return OrderResponse(
-                    status=FAILURE, error_msg=f"Order {order_id} already completed"
-                )
-            else:
-                order.canceled_quantity = order.quantity - order.filled_quantity
-                order.pending_quantity = 0
-                return OrderResponse(status=SUCCESS, data=order)
-        else:
+        if order.status == Status.COMPLETE:
             return OrderResponse(
-                status=FAILURE,
-                error_msg=f"Order id {order_id} not found on system",
+                status=FAILURE, error_msg=f"Order {order_id} already completed"
             )
+        order.canceled_quantity = order.quantity - order.filled_quantity
+        order.pending_quantity = 0
+        return OrderResponse(status=SUCCESS, data=order)
 
     def update_tickers(self, last_price: Dict[str, float]):
         """
@@ -462,6 +462,19 @@ def test_ticker_ltp(basic_ticker):
     assert ticker._low == 120.5
 
 
+def test_ticker_seed():
+    ticker1 = Ticker(name="aapl", initial_price=125)
+    ticker2 = Ticker(name="aapl", initial_price=125)
+    ticker1.seed(1000)
+    ticker2.seed(1000)
+    prices = [ticker1.ltp for i in range(15)]
+    random.seed(1)  # global state should not affect seeded tickers
+    assert [ticker2.ltp for i in range(15)] == prices
+    random.seed(1000)
+    ticker = Ticker(name="aapl", initial_price=125)
+    assert [ticker.ltp for i in range(15)] == prices
+
+
 def test_ticker_ohlc(basic_ticker):
     ticker = basic_ticker
     ticker.ohlc() == dict(open=125, high=125, low=125, close=125)
@@ -505,6 +518,8 @@ def test_vorder_side_error():
         order = VOrder(
             symbol="aapl", quantity=100, side="unknown", order_id="123456789"
         )
+    with pytest.raises(ValidationError):
+        order = VOrder(symbol="aapl", quantity=100, side="", order_id="123456789")
 
 
 def test_instrument_defaults():
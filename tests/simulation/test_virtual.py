@@ -1,4 +1,5 @@
 from omspy.simulation.virtual import *
+from omspy.simulation.virtual import _orderbook_prices
 import pytest
 import pendulum
 import random
@@ -116,6 +117,16 @@ def test_generate_price():
     assert generate_price(110, 100) == 107
 
 
+def test_generate_prices():
+    random.seed(100)
+    prices = [generate_price(110, 100) for i in range(10)]
+    random.seed(100)
+    assert generate_prices(10, 110, 100) == prices
+    assert generate_prices(0) == []
+    for price in generate_prices(20, start=1000, end=1005):
+        assert 1000 <= price < 1005
+
+
 def test_generate_orderbook_default():
     ob = generate_orderbook()
     ob.bid[-1].price == 99.96
@@ -164,6 +175,17 @@ def test_generate_orderbook_orders_count():
         assert b.orders_count <= b.quantity
 
 
+def test_generate_orderbook_cached_prices():
+    _orderbook_prices.cache_clear()
+    ob1 = generate_orderbook(bid=400, ask=405, depth=10, tick=1)
+    ob2 = generate_orderbook(bid=400, ask=405, depth=10, tick=1)
+    assert _orderbook_prices.cache_info().hits == 1
+    assert [b.price for b in ob1.bid] == [b.price for b in ob2.bid]
+    assert [a.price for a in ob1.ask] == [a.price for a in ob2.ask]
+    assert ob2.bid[-1].price == 391
+    assert ob2.ask[-1].price == 414
+
+
 def test_virtual_broker_defaults(basic_broker):
     b = basic_broker
     assert b.name == "VBroker"
@@ -171,6 +193,22 @@ def test_virtual_broker_defaults(basic_broker):
     assert b.failure_rate == 0.001
 
 
+def test_virtual_broker_tickers(basic_broker):
+    b = basic_broker
+    ticker = Ticker(name="tsla", initial_price=200)
+    b.tickers["tsla"] = ticker
+    assert b.tickers["tsla"] is ticker
+    b = VirtualBroker(tickers=dict(aapl=dict(name="aapl", initial_price=120)))
+    assert isinstance(b.tickers["aapl"], Ticker)
+    assert b.tickers["aapl"].ltp > 0
+    with pytest.raises(ValidationError):
+        VirtualBroker(tickers=dict(aapl=120))
+    with pytest.raises(ValidationError):
+        Ticker(name="aapl", initial_price="abc")
+    assert b.tickers["aapl"].dict()["initial_price"] == 120
+    assert "tickers" in b.schema()["properties"]
+
+
 def test_virtual_broker_is_failure(basic_broker):
     b = basic_broker
     assert b.is_failure is False
@@ -182,6 +220,61 @@ def test_virtual_broker_is_failure(basic_broker):
         b.failure_rate = 2
 
 
+def test_virtual_broker_is_failure_no_random_draw(basic_broker):
+    b = basic_broker
+    b.seed(1000)
+    state = b._rng.getstate()
+    b.failure_rate = 0.0
+    assert any(b.is_failure for i in range(100)) is False
+    b.failure_rate = 1.0
+    assert all(b.is_failure for i in range(100)) is True
+    assert b._rng.getstate() == state
+
+
+def test_virtual_broker_seed(basic_broker):
+    b = basic_broker
+    b.failure_rate = 0.5
+    b.seed(1000)
+    expected = [b.is_failure for i in range(20)]
+    b.seed(1000)
+    random.seed(1)
+    assert [b.is_failure for i in range(20)] == expected
+    assert True in expected and False in expected
+
+
+def test_virtual_broker_seed_get_by_status(basic_broker):
+    known = pendulum.datetime(2023, 2, 1, 10, 17)
+    filled = []
+    for global_seed in (1, 2):
+        b = VirtualBroker(failure_rate=0)
+        b.seed(1000)
+        with pendulum.test(known):
+            order_id = b.order_place(symbol="aapl", quantity=1000, side=1).data.order_id
+        random.seed(global_seed)
+        with pendulum.test(known.add(seconds=2)):
+            order = b.get(order_id, status=Status.PARTIAL_FILL)
+        filled.append(order.filled_quantity)
+    assert filled[0] == filled[1]
+    assert 0 < filled[0] < 1000
+
+
+def test_virtual_broker_copy_and_pickle(basic_broker):
+    import copy
+    import pickle
+
+    b = basic_broker
+    b.order_place(symbol="aapl", quantity=10, side=1)
+    for broker in (b.copy(deep=True), copy.deepcopy(b), pickle.loads(pickle.dumps(b))):
+        assert broker.tickers.keys() == b.tickers.keys()
+        assert broker.tickers["aapl"].ltp > 0
+    assert b.json()
+    b.seed(1000)
+    b.tickers["aapl"].seed(1000)
+    broker = pickle.loads(pickle.dumps(b))
+    assert broker.is_failure == b.is_failure
+    assert broker.tickers["aapl"].ltp == b.tickers["aapl"].ltp
+
+
 def test_virtual_broker_order_place_success(basic_broker):
     b = basic_broker
     known = pendulum.datetime(2023, 2, 1, 10, 17)
@@ -251,6 +344,26 @@ def test_virtual_broker_order_place_validation_error(basic_broker):
         assert response.data is None
 
 
+def test_virtual_broker_order_place_order_id(basic_broker):
+    b = basic_broker
+    b.failure_rate = 0.0
+    order_ids = [
+        b.order_place(symbol="aapl", quantity=10, side=1).data.order_id
+        for i in range(10)
+    ]
+    assert len(set(order_ids)) == 10
+    prefix = order_ids[0][:12]
+    assert [order_id[:12] for order_id in order_ids] == [prefix] * 10
+    values = [int(order_id[12:], 16) for order_id in order_ids]
+    assert values == list(range(1, 11))
+    other = VirtualBroker(failure_rate=0)
+    resp = other.order_place(symbol="aapl", quantity=10, side=1)
+    assert resp.data.order_id not in order_ids
+    assert resp.data.order_id[:12] != prefix
+    resp = b.order_place(symbol="aapl", quantity=10, side=1, order_id="abcd")
+    assert resp.data.order_id == "abcd"
+
+
 def test_virtual_broker_get(basic_broker):
     b = basic_broker
     for i in (50, 100, 130):
@@ -260,6 +373,21 @@ def test_virtual_broker_get(basic_broker):
     assert b.get(order_id) == list(b._orders.values())[1]
 
 
+def test_virtual_broker_order_place_duplicate_order_id(basic_broker):
+    b = basic_broker
+    b.failure_rate = 0.0
+    b.order_place(symbol="dow", side=1, quantity=50, order_id="x")
+    b.order_place(symbol="aapl", side=1, quantity=10)
+    resp = b.order_place(symbol="dow", side=1, quantity=20, order_id="x")
+    assert len(b._orders) == 2
+    assert b.get("x") is b._orders["x"]
+    assert b.get("x").quantity == 20
+    assert list(b._orders.keys())[0] == "x"
+    with pytest.raises(KeyError):
+        b._orders["unknown"]
+    assert len(b._orders) == 2
+
+
 def test_virtual_broker_order_modify(basic_broker):
     b = basic_broker
     order = b.order_place(symbol="dow", side=1, quantity=50)
@@ -286,6 +414,19 @@ def test_virtual_broker_order_modify_failure(basic_broker):
     assert resp.data is None
 
 
+def test_virtual_broker_order_not_found(basic_broker):
+    b = basic_broker
+    b.failure_rate = 0.5
+    b.seed(1000)
+    state = b._rng.getstate()
+    for method in (b.order_modify, b.order_cancel):
+        resp = method("hexid", quantity=25)
+        assert resp.status == "failure"
+        assert resp.error_msg == "Order id hexid not found on system"
+        assert resp.data is None
+    assert b._rng.getstate() == state
+
+
 def test_virtual_broker_order_modify_kwargs_response(basic_broker):
     b = basic_broker
     resp = b.order_modify("hexid", quantity=25, response=dict(a=10, b=15))